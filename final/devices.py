@@ -99,6 +99,9 @@ class Devices:
         self.names = names
 
         self.devices_list = []
+        # device_id -> Device, kept in step with devices_list by add_device so
+        # that get_device does not scan every device
+        self.devices_by_id = {}
 
         gate_strings = ["AND", "OR", "NAND", "NOR", "XOR", "NOT"]
         device_strings = ["CLOCK", "SWITCH", "DTYPE"]
@@ -128,13 +131,11 @@ class Devices:
             self.Q_ID, self.QBAR_ID] = self.names.lookup(dtype_outputs)
 
         self.max_gate_inputs = 16
+        self.gate_input_ids = []  # name IDs of I1, I2, ... filled by make_gate
 
     def get_device(self, device_id):
         """Return the Device object corresponding to device_id."""
-        for device in self.devices_list:
-            if device.device_id == device_id:
-                return device
-        return None
+        return self.devices_by_id.get(device_id)
 
     def find_devices(self, device_kind=None):
         """Return a list of device IDs of the specified device_kind.
@@ -155,6 +156,7 @@ class Devices:
         new_device = Device(device_id)
         new_device.device_kind = device_kind
         self.devices_list.append(new_device)
+        self.devices_by_id[device_id] = new_device
 
     def add_input(self, device_id, input_id):
         """Add the specified input to the specified device.
@@ -249,9 +251,13 @@ class Devices:
         self.add_device(device_id, device_kind)
         self.add_output(device_id, output_id=None)
 
-        for input_number in range(1, no_of_inputs + 1):
+        # look up each of "I1", "I2", ... only the first time a gate needs it
+        gate_input_ids = self.gate_input_ids
+        for input_number in range(len(gate_input_ids) + 1, no_of_inputs + 1):
             input_name = "".join(["I", str(input_number)])
-            [input_id] = self.names.lookup([input_name])
+            gate_input_ids.extend(self.names.lookup([input_name]))
+
+        for input_id in gate_input_ids[:no_of_inputs]:
             self.add_input(device_id, input_id)
 
     def make_d_type(self, device_id):
@@ -31,6 +31,8 @@ class Names:
                         the name ID. Returns None if the ID is not present.
     """
 
+    __slots__ = ("names_list", "error_code_count")
+
     def __init__(self):
         """Initialise names list."""
         self.names_list = []
@@ -66,9 +68,11 @@ class Names:
                 raise TypeError(
                     f"This element of name_string_list is {name}, "
                     "but elements of name_string_list must be strings")
-            elif name in self.names_list:
+            try:
+                # a single scan of names_list covers both the membership
+                # test and finding the index
                 list_of_name_ids.append(self.names_list.index(name))
-            else:
+            except ValueError:
                 self.names_list.append(name)
                 list_of_name_ids.append(len(self.names_list) - 1)
 
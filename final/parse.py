@@ -8,6 +8,21 @@ Classes
 -------
 Parser - parses the definition file and builds the logic network.
 """
+import logging
+from collections import namedtuple
+
+from scanner import KEYWORD, NUMBER, NAME, EOF, INVALID_CHAR, UNCLOSED
+
+log = logging.getLogger(__name__)
+
+# a device field "keyword : value ;" as data - the fixed opening as (symbol,
+# error if it is missing) pairs, the symbol type the value must have, the
+# error for a value of any other type (keyed by that type, or None for the
+# rest), where to recover from a bad opening or value and where to recover
+# from a missing semicolon
+_Field = namedtuple(
+    "_Field",
+    "opening value_type value_errors error_next semicolon_next")
 
 
 class Parser:
@@ -32,6 +47,8 @@ class Parser:
     parse_network(self): Parses the circuit definition file. Returns True
                          only if no syntax or semantic errors are found,
                          otherwise returns False.
+
+    report(self): Prints the messages collected in error_message_list.
     """
 
     def __init__(self, names, devices, network, monitors, scanner):
@@ -41,6 +58,12 @@ class Parser:
         self.network = network
         self.monitors = monitors
         self.scanner = scanner
+        self._get_symbol = scanner.get_symbol  # called once per token
+        # bound once as they are called for every name or every built item
+        self._get_name_string = names.get_name_string
+        self._make_device = devices.make_device
+        self._make_connection = network.make_connection
+        self._make_monitor = monitors.make_monitor
 
         self.error_count = 0
         self.end_of_file = False  # if the end of file is reached
@@ -51,113 +74,191 @@ class Parser:
         self.error_message_list = []  # list of terminal output to be passed
         # to GUI
 
+        # the three device fields, in the order a device lists them
+        self._id_field = _Field(
+            opening=(
+                (scanner.ID_KEYWORD_ID, _("expected id keyword here")),
+                (scanner.COLON, _("expected") + " :"),
+            ),
+            value_type=NAME,
+            value_errors={
+                KEYWORD: _("Invalid name provided - ") +
+                _("a keyword cannot be used as a device name"),
+                None: _("Invalid name provided - ") +
+                _("a device name should be alphanumeric"),
+            },
+            error_next=frozenset((scanner.KIND_KEYWORD_ID,)),
+            semicolon_next=frozenset((scanner.OPEN_CURLY,)),
+        )
+        self._kind_field = _Field(
+            opening=(
+                (scanner.KIND_KEYWORD_ID, _("expected") + " 'kind'"),
+                (scanner.COLON, _("expected") + " :"),
+            ),
+            value_type=NAME,
+            value_errors={None: _("Device type must be alphanumeric")},
+            error_next=frozenset(
+                (scanner.QUAL_KEYWORD_ID, scanner.CLOSE_CURLY)),
+            semicolon_next=frozenset(
+                (scanner.OPEN_CURLY, scanner.CLOSE_SQUARE)),
+        )
+        self._qual_field = _Field(
+            opening=(
+                (scanner.QUAL_KEYWORD_ID, _("expected") + " 'qual"),
+                (scanner.COLON, _("expected") + " :"),
+            ),
+            value_type=NUMBER,
+            value_errors={None: _("unsupported qualifier input")},
+            error_next=frozenset((scanner.CLOSE_CURLY,)),
+            semicolon_next=frozenset(
+                (scanner.OPEN_CURLY, scanner.CLOSE_SQUARE)),
+        )
+
+        # recovery sets handed to _error, built once here rather than as a
+        # fresh list at each call site; _error tests both symbol ids and
+        # symbol types against them
+        self._after_devices = frozenset(
+            (scanner.CONNECTIONS_ID, scanner.MONITOR_ID))
+        self._after_connections = frozenset((scanner.MONITOR_ID, EOF))
+        self._after_monitors = frozenset((scanner.CONNECTIONS_ID, EOF))
+        self._next_device = frozenset(
+            (scanner.OPEN_CURLY, scanner.CLOSE_CURLY))
+        self._after_device_close = frozenset(
+            (scanner.OPEN_CURLY, scanner.CONNECTIONS_ID, scanner.MONITOR_ID))
+        self._next_signal = frozenset((NAME,))
+        self._next_devices_list = frozenset((scanner.DEVICES_ID,))
+        self._next_list = frozenset(
+            (scanner.DEVICES_ID, scanner.CONNECTIONS_ID, scanner.MONITOR_ID,
+             EOF))
+        self._next_device_open = frozenset((scanner.OPEN_CURLY,))
+        self._next_in_devices = frozenset(
+            (scanner.OPEN_CURLY, scanner.CLOSE_SQUARE, scanner.CONNECTIONS_ID,
+             scanner.MONITOR_ID, EOF))
+        self._next_in_connections = frozenset(
+            (NAME, scanner.CLOSE_SQUARE, scanner.MONITOR_ID, EOF))
+        self._after_signal = frozenset(
+            (NAME, scanner.CLOSE_SQUARE, scanner.MONITOR_ID))
+
+        # make_device error code -> (message, which of the device's name,
+        # kind and qual symbols to point at); {name} and {kind} are filled
+        # in when the error is reported
+        self._device_errors = {
+            devices.NO_QUALIFIER: (
+                "{kind} " + _("qualifier not present."), 2),
+            devices.INVALID_QUALIFIER: (
+                "{kind} " + _("qualifier is invalid."), 1),
+            devices.QUALIFIER_PRESENT: (
+                _("Qualifier provided for ") + "{kind} "
+                + _("when there should be none."), 2),
+            devices.BAD_DEVICE: (
+                _("Device kind") + " {kind} " + "not recognised.", 1),
+            devices.DEVICE_PRESENT: (
+                _("Device ") + "{name} " + _("already present."), 0),
+        }
+        # make_connection error code -> (message, key of the right signal's
+        # symbol to point at, or None); {signal} is the right signal's name
+        self._connection_errors = {
+            network.DEVICE_ABSENT: (
+                _("Either left or right device is absent"), None),
+            network.INPUT_CONNECTED: (
+                "{signal} " + _("input is already connected."),
+                "device_id"),
+            network.INPUT_TO_INPUT: (_("Both ports are inputs."), None),
+            network.PORT_ABSENT: (_("Right port id is invalid."), "port_id"),
+            network.OUTPUT_TO_OUTPUT: (_("Both ports are outputs."), None),
+        }
+        # make_monitor error code -> (message, key of the signal's symbol to
+        # point at, or None); {signal} is the monitored signal's name
+        self._monitor_errors = {
+            network.DEVICE_ABSENT: (
+                _("Device you are trying to monitor is absent."),
+                "device_id"),
+            monitors.NOT_OUTPUT: ("{signal} " + _("is not an output."), None),
+            monitors.MONITOR_PRESENT: (
+                _("Already monitoring") + " {signal}.", "device_id"),
+        }
+
+        # list keyword -> (parse the list, error if the list is repeated,
+        # where to recover after that error, error if DEVICES is not done
+        # yet or None for DEVICES itself)
+        self._list_parsers = {
+            scanner.DEVICES_ID: (
+                lambda: self._parse_devices_list(),
+                _("Multiple device lists found."),
+                frozenset((scanner.CONNECTIONS_ID, scanner.MONITOR_ID, EOF)),
+                None,
+            ),
+            scanner.CONNECTIONS_ID: (
+                lambda: self._parse_connections_list(self.error_count),
+                _("Multiple connections lists found."),
+                self._after_connections,
+                _("can't parse connections if not done devices"),
+            ),
+            scanner.MONITOR_ID: (
+                lambda: self._parse_monitors_list(self.error_count),
+                _("Multiple monitors lists found."),
+                self._after_monitors,
+                _("can't parse monitors if not done devices"),
+            ),
+        }
+
     def parse_network(self):
         """Parse the circuit definition file."""
-        devices_done = False
-        connections_done = False
-        monitors_done = False
+        # scanner IDs are bound as locals in the looping parse methods to
+        # skip repeated self.scanner lookups
+        DEVICES_ID = self.scanner.DEVICES_ID
+
         self._set_next()
 
-        if self.symbol.type == self.scanner.EOF and not \
+        if self.symbol.type == EOF and not \
                 self.unclosed_comment:
             # this is when we get an empty file - we would like to show
             # an error
 
             self._error(_("Empty definition file was loaded."),
-                        [self.scanner.EOF])
+                        [EOF])
 
             final_err = (
                     f"\n" + _("Completely parsed the definition file.") +
                     f" {self.error_count} "
                     + _("error(s) found in total.")
             )
-            print(final_err)
             self.error_message_list.append(final_err)
 
             return False
 
+        done = set()  # list keywords already parsed
         while True:
-
-            if self.symbol.id == self.scanner.DEVICES_ID:
-                if devices_done:
-                    self._error(
-                        _("Multiple device lists found."),
-                        [
-                            self.scanner.CONNECTIONS_ID,
-                            self.scanner.MONITOR_ID,
-                            self.scanner.EOF
-                        ],
-                    )
-                else:
-                    self._parse_devices_list()
-                    devices_done = True
-
-            elif self.symbol.id == self.scanner.CONNECTIONS_ID:
-                if connections_done:
-                    self._error(
-                        _("Multiple connections lists found."),
-                        [
-                            self.scanner.MONITOR_ID,
-                            self.scanner.EOF
-                        ],
-                    )
-                else:
-                    if devices_done:
-                        self._parse_connections_list(self.error_count)
-                        connections_done = True
-                    else:
-                        self._error(
-                            _("can't parse connections if not done devices"),
-                            [self.scanner.DEVICES_ID],
-                        )
-                        if self._is_eof():
-                            break
-
-            elif self.symbol.id == self.scanner.MONITOR_ID:
-                if monitors_done:
-                    self._error(
-                        _("Multiple monitors lists found."),
-                        [
-                            self.scanner.CONNECTIONS_ID,
-                            self.scanner.EOF
-                        ],
-                    )
+            list_parser = self._list_parsers.get(self.symbol.id)
+
+            if list_parser is not None:
+                parse_list, repeat_msg, repeat_next, order_msg = list_parser
+                if self.symbol.id in done:
+                    self._error(repeat_msg, repeat_next)
+                elif order_msg is not None and DEVICES_ID not in done:
+                    self._error(order_msg, self._next_devices_list)
+                    if self.symbol.type == EOF:
+                        break
                 else:
-                    if devices_done:
-                        self._parse_monitors_list(self.error_count)
-                        monitors_done = True
-                    else:
-                        self._error(
-                            _("can't parse monitors if not done devices"),
-                            [self.scanner.DEVICES_ID],
-                        )
-                        if self._is_eof():
-                            break
-            elif self._is_eof():
+                    done.add(self.symbol.id)
+                    parse_list()
+            elif self.symbol.type == EOF:
                 break
             else:
                 self._error(
                     _("not DEVICES, CONNECTIONS, MONITORS nor EOF"),
-                    [
-                        self.scanner.DEVICES_ID,
-                        self.scanner.CONNECTIONS_ID,
-                        self.scanner.MONITOR_ID,
-                        self.scanner.EOF,
-                    ],
-                )
-                if self._is_eof():
+                    self._next_list)
+                if self.symbol.type == EOF:
                     break
 
         if not self.network.check_network():
             unconnected = _("Network is incomplete") + \
                           _(" - all inputs must be connected.")
             self.error_count += 1
-            print(unconnected)
             self.error_message_list.append(unconnected)
 
         final_msg = (_("Completely parsed the definition file.") +
                      f" {self.error_count} " + _("error(s) found in total."))
-        print(final_msg)
         self.error_message_list.append(final_msg)
 
         if self.error_count == 0:  # syn + sem errors = 0
@@ -165,29 +266,34 @@ class Parser:
         else:
             return False
 
+    def report(self):
+        """Print the messages collected during parsing to the terminal."""
+        for message in self.error_message_list:
+            print(message)
+
     def _parse_devices_list(self):
         """Parse list of devices."""
+        CONNECTIONS_ID = self.scanner.CONNECTIONS_ID
+        MONITOR_ID = self.scanner.MONITOR_ID
+        CLOSE_SQUARE = self.scanner.CLOSE_SQUARE
+        OPEN_CURLY = self.scanner.OPEN_CURLY
+
         self._set_next()
         if self.unclosed_comment:
             return
 
         while True:
-            if self.symbol.id != self.scanner.OPEN_SQUARE:
-                self._error(
-                    _("expected") + " [", [
-                        self.scanner.CONNECTIONS_ID, self.scanner.MONITOR_ID])
-                break
-
-            self._set_next()
-            if self.unclosed_comment:
+            if not self._expect(self.scanner.OPEN_SQUARE,
+                                _("expected") + " [", self._after_devices):
                 break
 
-            parsing_devices = True
-            while parsing_devices:
+            # one device per pass - _parse_device leaves the symbol after the
+            # device, so the next pass can test it straight away
+            while True:
                 if self.end_of_file:
                     break
 
-                if self.symbol.id == self.scanner.CLOSE_SQUARE:
+                if self.symbol.id == CLOSE_SQUARE:
                     # if empty DEVICES list
                     break
 
@@ -201,25 +307,24 @@ class Parser:
                     # continue parsing with
                     warn = _("missed semicolon at end of device definition, ")\
                         + _("will end up skipping the device after")
-                    print(warn)
                     self.error_message_list.append(warn)
 
-                if self.symbol.id == self.scanner.OPEN_CURLY:
-                    parsing_devices = True
-                elif self.symbol.id == self.scanner.CLOSE_SQUARE:
-                    parsing_devices = False
+                if self.symbol.id == OPEN_CURLY:
+                    continue
+                elif self.symbol.id == CLOSE_SQUARE:
+                    break
                 elif (
-                        self.symbol.id == self.scanner.MONITOR_ID
-                        or self.symbol.id == self.scanner.CONNECTIONS_ID
+                        self.symbol.id == MONITOR_ID
+                        or self.symbol.id == CONNECTIONS_ID
                 ):
                     # error skips to end of devices
                     break
-                elif self.symbol.type == self.scanner.INVALID_CHAR:
+                elif self.symbol.type == INVALID_CHAR:
                     # unknown character encountered
                     self._error(
-                        _("invalid character encountered"), [
-                            self.scanner.OPEN_CURLY])
-                elif self.symbol.type == self.scanner.EOF:
+                        _("invalid character encountered"),
+                        self._next_device_open)
+                elif self.symbol.type == EOF:
                     # reached end of file through error recovery in inner loop
                     break
                 else:
@@ -228,39 +333,34 @@ class Parser:
                     # if not those then look for connections/monitors
                     # if not those then EOF
 
-                    self._get_symbol_string()
                     self._error(_("Invalid input to a DEVICES list. Devices ")
                                 + _(
                         "should start with '{', or the list should ")
                                 + _("end with ']' "),
-                                [self.scanner.OPEN_CURLY,
-                                 self.scanner.CLOSE_SQUARE,
-                                 self.scanner.CONNECTIONS_ID,
-                                 self.scanner.MONITOR_ID,
-                                 self.scanner.EOF])
+                                self._next_in_devices)
 
-                    if self.symbol.id == self.scanner.CLOSE_SQUARE:
+                    if self.symbol.id == CLOSE_SQUARE:
                         break
-                    elif self.symbol.id == self.scanner.OPEN_CURLY:
+                    elif self.symbol.id == OPEN_CURLY:
                         continue
                     elif self.end_of_file:
                         return
-                    elif self.symbol.id == self.scanner.CONNECTIONS_ID or \
-                            self.symbol.id == self.scanner.MONITOR_ID:
+                    elif self.symbol.id == CONNECTIONS_ID or \
+                            self.symbol.id == MONITOR_ID:
                         break
 
             if (
-                    self.symbol.id == self.scanner.MONITOR_ID
-                    or self.symbol.id == self.scanner.CONNECTIONS_ID
+                    self.symbol.id == MONITOR_ID
+                    or self.symbol.id == CONNECTIONS_ID
             ):
                 break
 
             # no longer parsing devices
-            if (self.symbol.id != self.scanner.CLOSE_SQUARE and
-                    not self._is_eof()):
+            if (self.symbol.id != CLOSE_SQUARE and
+                    self.symbol.type != EOF):
                 self._error(
                     _("expected") + " ]",
-                    [self.scanner.CONNECTIONS_ID, self.scanner.MONITOR_ID])
+                    self._after_devices)
                 break
 
             self._set_next()
@@ -269,14 +369,13 @@ class Parser:
 
             if self.symbol.id != self.scanner.SEMICOLON:
                 self._error(
-                    _("expected") + " ;", [
-                        self.scanner.MONITOR_ID, self.scanner.CONNECTIONS_ID])
+                    _("expected") + " ;", self._after_devices)
                 break
 
             if self.error_count != 0:
                 break
 
-            print(_("Successfully parsed the DEVICES list! \n"))
+            log.debug(_("Successfully parsed the DEVICES list! \n"))
             self._set_next()
             if self.unclosed_comment:
                 return
@@ -286,8 +385,8 @@ class Parser:
         if self.end_of_file:
             pass
         elif (
-                self.symbol.id != self.scanner.MONITOR_ID
-                and self.symbol.id != self.scanner.CONNECTIONS_ID
+                self.symbol.id != MONITOR_ID
+                and self.symbol.id != CONNECTIONS_ID
         ):
             self._set_next()
             if self.unclosed_comment:
@@ -296,321 +395,151 @@ class Parser:
         if self.error_count != 0:
             err = f"{self.error_count} " + _("error(s) found ") \
                   + _("when parsing the DEVICES list \n")
-            print(err)
             self.error_message_list.append(err)
             return False
 
     def _parse_device(self, previous_errors):
         """Parse a single device."""
-        missing_device_semicolon = False
         device_qual_symbol = None  # initialising for semantic reporting
-        device_kind_symbol = None  # initialising for semantic reporting
-        device_name = None
-        while True:
-            if self.symbol.id != self.scanner.OPEN_CURLY:
-                self._error(
-                    _("expected") + " {", [
-                        self.scanner.OPEN_CURLY, self.scanner.CLOSE_CURLY])
-                break
-
-            self._set_next()
-            if self.unclosed_comment:
-                return True
-
-            missing_semicolon, device_name, device_name_symbol = \
-                self._parse_device_id()
 
+        matched = self._expect(
+            self.scanner.OPEN_CURLY, _("expected") + " {", self._next_device)
+        if not matched:
+            return matched is None
+
+        # a missed semicolon in a field causes the entire device to be
+        # skipped - that is only reported as such if the file goes on
+        missing_semicolon, device_name, device_name_symbol = \
+            self._parse_device_id()
+        if missing_semicolon:
+            return self.end_of_file
+
+        missing_semicolon, device_kind_id, device_kind_symbol = \
+            self._parse_device_kind()
+        if missing_semicolon:
+            return self.end_of_file
+
+        if self.symbol.id == self.scanner.QUAL_KEYWORD_ID:
+            missing_semicolon, device_qual, device_qual_symbol = \
+                self._parse_device_qual()
             if missing_semicolon:
-                if self.end_of_file:
-                    return True
-                # missed semicolon causes entire device to be skipped
-                break
-
-            (
-                missing_semicolon,
-                device_kind_string,
-                device_kind_id,
-                device_kind_symbol
-            ) = self._parse_device_kind()
-
-            if missing_semicolon:
-                if self.end_of_file:
-                    return True
-                # missed semicolon causes entire device to be skipped
-                break
-
-            if self.symbol.id == self.scanner.QUAL_KEYWORD_ID:
-                missing_semicolon, device_qual, device_qual_symbol = \
-                    self._parse_device_qual()
-                if missing_semicolon:
-                    if self.end_of_file:
-                        return True
-                    # missed semicolon causes entire device to be skipped
-                    break
-            else:
-                device_qual = None
+                return self.end_of_file
+        else:
+            device_qual = None
 
-            if self.symbol.id != self.scanner.CLOSE_CURLY:
-                self._error(
-                    _("expected") + " }", [
-                        self.scanner.OPEN_CURLY, self.scanner.CLOSE_CURLY])
-                break
+        matched = self._expect(
+            self.scanner.CLOSE_CURLY, _("expected") + " }", self._next_device)
+        if not matched:
+            return matched is None
 
-            self._set_next()
-            if self.unclosed_comment:
-                return True
+        if self.symbol.id != self.scanner.SEMICOLON:
+            self._error(
+                _("expected") + " ;", self._after_device_close)
+            # if MONITORS or CONNECTIONS, stop parsing devices
+            return True
 
-            if self.symbol.id != self.scanner.SEMICOLON:
-                self._error(
-                    _("expected") + " ;",
-                    [
-                        self.scanner.OPEN_CURLY,
-                        self.scanner.CONNECTIONS_ID,
-                        self.scanner.MONITOR_ID,
-                    ],
-                )
-                # if MONITORS or CONNECTIONS, stop parsing devices
-                missing_device_semicolon = True
-                break
+        # if we get here we have done a whole device, which is only built if
+        # parsing it found no new syntax errors
+        if self.error_count - previous_errors == 0:
 
-            # if we get here we have done a whole device
-            # for each device there are no new syntax errors
-            if self.error_count - previous_errors == 0:
+            # the name symbol's id is the device id - no need to query
+            # the names list for it again
+            error_type = self._make_device(
+                device_name_symbol.id, device_kind_id, device_qual
+            )
 
-                error_type = self.devices.make_device(
-                    self.names.query(device_name), device_kind_id, device_qual
+            # if there is a semantic error
+            if error_type != self.devices.NO_ERROR:
+                message, at = self._device_errors[error_type]
+                self._semantic_error(
+                    message.format(
+                        kind=self._get_name_string(device_kind_id),
+                        name=device_name),
+                    (device_name_symbol, device_kind_symbol,
+                     device_qual_symbol)[at]
                 )
 
-                # if there is a semantic error
-                if error_type != self.devices.NO_ERROR:
-                    if error_type == self.devices.NO_QUALIFIER:
-                        self._semantic_error(
-                            f"{device_kind_string} " + _(
-                                "qualifier not present."),
-                            device_qual_symbol
-                        )
-                    elif error_type == self.devices.INVALID_QUALIFIER:
-                        self._semantic_error(
-                            f"{device_kind_string} " + _(
-                                "qualifier is invalid."),
-                            device_kind_symbol
-                        )
-                    elif error_type == self.devices.QUALIFIER_PRESENT:
-                        self._semantic_error(
-                            _(
-                                "Qualifier provided for ") +
-                            f"{device_kind_string} "
-                            + _("when there should be none."),
-                            device_qual_symbol
-                        )
-                    elif error_type == self.devices.BAD_DEVICE:
-                        self._semantic_error(
-                            _("Device kind") + f" {device_kind_string} "
-                            + ("not recognised."), device_kind_symbol
-                        )
-                    elif error_type == self.devices.DEVICE_PRESENT:
-                        self._semantic_error(
-                            _("Device ") + f"{device_name} " + _(
-                                "already present."),
-                            device_name_symbol
-                        )
-
-                self._set_next()
-                if self.unclosed_comment:
-                    return True
-
-                break
-            else:
-                # syntactic errors found when parsing the device
-                self._set_next()
-                if self.unclosed_comment:
-                    return True
-                break
+        self._set_next()
+        if self.unclosed_comment:
+            return True
 
-        return missing_device_semicolon
+        return False
 
     def _parse_device_id(self):
         """Parse a device id."""
-        missing_semicolon = False
-        device_name = None
-        symbol_for_device_name = None
-        while True:
-            if self.symbol.id != self.scanner.ID_KEYWORD_ID:
-                self._error(
-                    _("expected id keyword here"), [
-                        self.scanner.KIND_KEYWORD_ID])
-                break
-
-            self._set_next()
-            if self.unclosed_comment:
-                return True, device_name, symbol_for_device_name
-
-            if self.symbol.id != self.scanner.COLON:
-                self._error(_("expected") + " :",
-                            [self.scanner.KIND_KEYWORD_ID])
-                break
-
-            self._set_next()
-            if self.unclosed_comment:
-                return True, device_name, symbol_for_device_name
-
-            if self.symbol.type != self.scanner.NAME:
-                # name provided is syntactically incorrect for a name
-                if self.symbol.type == self.scanner.KEYWORD:
-                    self._error(
-                        _("Invalid name provided - ") +
-                        _("a keyword cannot be used as a device name"), [
-                            self.scanner.KIND_KEYWORD_ID])
-                    break
-                else:
-                    self._error(
-                        _("Invalid name provided - ") +
-                        _("a device name should be alphanumeric"), [
-                            self.scanner.KIND_KEYWORD_ID])
-                    break
-            else:
-                device_name = self._get_symbol_string()
-                symbol_for_device_name = self.symbol
-
-            self._set_next()
-            if self.unclosed_comment:
-                return True, device_name, symbol_for_device_name
-
-            if self.symbol.id != self.scanner.SEMICOLON:
-                self._error(_("Missing semicolon"), [self.scanner.OPEN_CURLY])
-                missing_semicolon = True
-                break
-
-            self._set_next()
-            if self.unclosed_comment:
-                return True, device_name, symbol_for_device_name
+        missing_semicolon, name_symbol = self._parse_field(self._id_field)
+        if name_symbol is None:
+            device_name = None
+        else:
+            device_name = self._get_name_string(name_symbol.id)
 
-            break
+        if missing_semicolon is None:
+            return True, device_name, name_symbol
 
-        self._get_symbol_string()
-        return missing_semicolon, device_name, symbol_for_device_name
+        return missing_semicolon, device_name, name_symbol
 
     def _parse_device_kind(self):
         """Parse a device kind."""
-        missing_semicolon = False
-        device_kind_string = None  # may cause sem errors when creating devices
-        device_kind_id = None
-        symbol_for_device_kind = None
-        while True:
-            if self.symbol.id != self.scanner.KIND_KEYWORD_ID:
-                self._error(
-                    _("expected") + " 'kind'",
-                    [self.scanner.QUAL_KEYWORD_ID, self.scanner.CLOSE_CURLY],
-                )
-                break
-                # this causes small issue with error counting for unclosed
-                # comments - deal with if time
+        missing_semicolon, kind_symbol = self._parse_field(self._kind_field)
+        if missing_semicolon is None:
+            return True, None, None
+        if kind_symbol is None:
+            return missing_semicolon, None, None
 
-            self._set_next()
-            if self.unclosed_comment:
-                return True, None, None, None
-
-            if self.symbol.id != self.scanner.COLON:
-                self._error(
-                    _("expected") + " :",
-                    [self.scanner.QUAL_KEYWORD_ID, self.scanner.CLOSE_CURLY],
-                )
-                break
-
-            self._set_next()
-            if self.unclosed_comment:
-                return True, None, None, None
-
-            if self.symbol.type != self.scanner.NAME:
-                self._error(
-                    _("Device type must be alphanumeric"),
-                    [self.scanner.QUAL_KEYWORD_ID, self.scanner.CLOSE_CURLY],
-                )
-                break
-            else:
-                device_kind_string = self._get_symbol_string()
-                [device_kind_id] = self.devices.names.lookup(
-                    [device_kind_string])
-                symbol_for_device_kind = self.symbol
-
-            self._set_next()
-            if self.unclosed_comment:
-                return True, None, None, None
-
-            if self.symbol.id != self.scanner.SEMICOLON:
-                self._error(
-                    _("Missing semicolon"),
-                    [self.scanner.OPEN_CURLY, self.scanner.CLOSE_SQUARE],
-                )
-                missing_semicolon = True
-                break
-
-            self._set_next()
-            if self.unclosed_comment:
-                return True, None, None, None
-
-            break
-
-        return missing_semicolon, device_kind_string, device_kind_id, \
-            symbol_for_device_kind
+        # the scanner looked the kind up in the names list, so the symbol's
+        # id is already the kind id make_device expects
+        return missing_semicolon, kind_symbol.id, kind_symbol
 
     def _parse_device_qual(self):
         """Parse a device qualifier."""
-        missing_semicolon = False
-        device_qual = None
-        symbol_for_device_qual = None
-        while True:
-            if self.symbol.id != self.scanner.QUAL_KEYWORD_ID:
-                self._error(
-                    _("expected") + " 'qual",
-                    [self.scanner.CLOSE_CURLY])
-                break
-
-            self._set_next()
-            if self.unclosed_comment:
-                return True, None, None
-
-            if self.symbol.id != self.scanner.COLON:
-                self._error(
-                    _("expected") + " :",
-                    [self.scanner.CLOSE_CURLY])
-                break
-
-            self._set_next()
-            if self.unclosed_comment:
-                return True, None, None
-
-            if self.symbol.type != self.scanner.NUMBER:
-                self._error(
-                    _("unsupported qualifier input"), [
-                        self.scanner.CLOSE_CURLY])
-                break
-            else:
-                device_qual = self.symbol.id
-                symbol_for_device_qual = self.symbol
-
-            self._set_next()
-            if self.unclosed_comment:
-                return True, None, None
-
-            if self.symbol.id != self.scanner.SEMICOLON:
-                self._error(
-                    "Missing semicolon",
-                    [self.scanner.OPEN_CURLY, self.scanner.CLOSE_SQUARE],
-                )
-                missing_semicolon = True
-                break
+        missing_semicolon, qual_symbol = self._parse_field(self._qual_field)
+        if missing_semicolon is None:
+            return True, None, None
+        if qual_symbol is None:
+            return missing_semicolon, None, None
+
+        return missing_semicolon, qual_symbol.id, qual_symbol
+
+    def _parse_field(self, field):
+        """Parse one "keyword : value ;" device field.
+
+        field is one of the _Field schemas built in __init__. Return whether
+        the closing semicolon was missing - None if an unclosed comment was
+        found first - and the value's symbol, or None if the value was not
+        reached or had the wrong type.
+        """
+        matched = self._expect_all(field.opening, field.error_next)
+        if matched is None:
+            return None, None
+        if not matched:
+            # this causes small issue with error counting for unclosed
+            # comments - deal with if time
+            return False, None
+
+        if self.symbol.type != field.value_type:
+            value_errors = field.value_errors
+            self._error(
+                value_errors.get(self.symbol.type, value_errors[None]),
+                field.error_next)
+            return False, None
 
-            self._set_next()
-            if self.unclosed_comment:
-                return True, None, None
+        value_symbol = self.symbol
+        self._set_next()
+        if self.unclosed_comment:
+            return None, value_symbol
 
-            break
+        matched = self._expect(self.scanner.SEMICOLON,
+                               _("Missing semicolon"), field.semicolon_next)
+        if matched is None:
+            return None, value_symbol
 
-        return missing_semicolon, device_qual, symbol_for_device_qual
+        return not matched, value_symbol
 
     def _parse_connections_list(self, previous_errors):
         """Parse list of connections."""
+        MONITOR_ID = self.scanner.MONITOR_ID
+        CLOSE_SQUARE = self.scanner.CLOSE_SQUARE
+
         self._set_next()
 
         while True:
@@ -618,19 +547,16 @@ class Parser:
                 break
             if self.symbol.id != self.scanner.OPEN_SQUARE:
                 self._error(
-                    _("expected") + " [", [
-                        self.scanner.MONITOR_ID, self.scanner.EOF])
+                    _("expected") + " [", self._after_connections)
                 # it could also be end of file, connections not necessary
                 break
             self._set_next()
 
-            parsing_connections = True
-            while parsing_connections:
+            while True:
                 if self.end_of_file:
                     break
 
-                if self.symbol.id == self.scanner.CLOSE_SQUARE:
-                    parsing_connections = False
+                if self.symbol.id == CLOSE_SQUARE:
                     break
 
                 missing_semicolon = self._parse_connection(self.error_count)
@@ -640,53 +566,46 @@ class Parser:
                     # the file we can break here
                     break
                 if missing_semicolon:
-                    if self.symbol.id == self.scanner.MONITOR_ID:
+                    if self.symbol.id == MONITOR_ID:
                         break
                     continue
 
-                if self.symbol.type == self.scanner.NAME:
-                    parsing_connections = True
-                elif self.symbol.id == self.scanner.CLOSE_SQUARE:
-                    parsing_connections = False
-                    break
-                elif self.symbol.id == self.scanner.MONITOR_ID:
-                    parsing_connections = False
+                if self.symbol.type == NAME:
+                    continue
+                elif (
+                        self.symbol.id == CLOSE_SQUARE
+                        or self.symbol.id == MONITOR_ID
+                ):
                     break
-                elif self.symbol.type == self.scanner.INVALID_CHAR:
+                elif self.symbol.type == INVALID_CHAR:
                     # unknown character encountered
                     self._error(
-                        _("invalid character encountered"), [
-                            self.scanner.NAME])
-                elif self.symbol.type == self.scanner.KEYWORD:
+                        _("invalid character encountered"), self._next_signal)
+                elif self.symbol.type == KEYWORD:
                     self._error(_("Cannot use a KEYWORD for a signal name"),
-                                [self.scanner.NAME])
+                                self._next_signal)
                 else:
                     self._error(_("Unknown Error"),
-                                [self.scanner.NAME,
-                                 self.scanner.CLOSE_SQUARE,
-                                 self.scanner.MONITOR_ID,
-                                 self.scanner.EOF
-                                 ])
-                    if self.symbol.id == self.scanner.CLOSE_SQUARE:
+                                self._next_in_connections)
+                    if self.symbol.id == CLOSE_SQUARE:
                         break
-                    elif self.symbol.type == self.scanner.NAME:
+                    elif self.symbol.type == NAME:
                         continue
                     elif self.end_of_file:
                         break
-                    elif self.symbol.id == self.scanner.MONITOR_ID:
+                    elif self.symbol.id == MONITOR_ID:
                         break
 
             if self.end_of_file:
                 break
 
-            if self.symbol.id == self.scanner.MONITOR_ID:
+            if self.symbol.id == MONITOR_ID:
                 break
 
             # no longer parsing connections
-            if self.symbol.id != self.scanner.CLOSE_SQUARE:
+            if self.symbol.id != CLOSE_SQUARE:
                 self._error(
-                    _("expected") + " ]", [
-                        self.scanner.MONITOR_ID, self.scanner.EOF])
+                    _("expected") + " ]", self._after_connections)
                 break
 
             self._set_next()
@@ -695,14 +614,13 @@ class Parser:
 
             if self.symbol.id != self.scanner.SEMICOLON:
                 self._error(
-                    _("expected") + " ;", [
-                        self.scanner.MONITOR_ID, self.scanner.EOF])
+                    _("expected") + " ;", self._after_connections)
                 break
 
             if self.error_count - previous_errors != 0:
                 break
 
-            print(_("Successfully parsed the CONNECTIONS list! \n"))
+            log.debug(_("Successfully parsed the CONNECTIONS list! \n"))
             self._set_next()
             if self.unclosed_comment:
                 return
@@ -711,7 +629,7 @@ class Parser:
 
         if self.end_of_file:
             pass
-        elif self.symbol.id != self.scanner.MONITOR_ID:
+        elif self.symbol.id != MONITOR_ID:
             self._set_next()
             if self.unclosed_comment:
                 return
@@ -723,173 +641,139 @@ class Parser:
                     _("CONNECTIONS list \n")
             )
 
-            print(err)
-
             self.error_message_list.append(err)
             return False
 
     def _parse_connection(self, previous_errors):
         """Parse a single connection."""
-        missing_signal_end_marker = False
-        symbol_store_right = {}  # initialising for semantic error reporting
-        while True:
-            if self.symbol.id == self.scanner.SEMICOLON:
-                self._error(
-                    _("No connection found before semicolon"),
-                    [self.scanner.NAME])
-                break
-            (
-                missing_signal_end_marker,
-                leftOutputId,
-                leftPortId,
-                leftSignalName,
-                symbol_store_left
-            ) = self._parse_signal()
-            if self.end_of_file:
-                break
-            if missing_signal_end_marker:
-                print(
-                    _("missed colon in connection, ") +
-                    _("will skip to next connection"))
-                break
-            self._set_next()
-            if self.unclosed_comment:
-                return True
-
-            (
-                missing_signal_end_marker,
-                rightOutputId,
-                rightPortId,
-                rightSignalName,
-                symbol_store_right
-            ) = self._parse_signal()
-            if self.end_of_file:
-                break
-            if missing_signal_end_marker:
-                # if time, print a warning
-                break
+        if self.symbol.id == self.scanner.SEMICOLON:
+            self._error(
+                _("No connection found before semicolon"),
+                self._next_signal)
+            return False
 
-            if self.error_count - previous_errors == 0:
-                # no syntax errors found when parsing connection
-                error_type = self.network.make_connection(
-                    leftOutputId, leftPortId, rightOutputId, rightPortId
-                )
+        (
+            missing_signal_end_marker,
+            leftOutputId,
+            leftPortId,
+            symbol_store_left
+        ) = self._parse_signal()
+        if self.end_of_file:
+            return missing_signal_end_marker
+        if missing_signal_end_marker:
+            warn = _("missed colon in connection, ") + \
+                _("will skip to next connection")
+            self.error_message_list.append(warn)
+            return True
 
-                if error_type != self.network.NO_ERROR:
-                    if error_type == self.network.DEVICE_ABSENT:
-                        self._semantic_error(
-                            _("Either left or right device is absent"))
-                    elif error_type == self.network.INPUT_CONNECTED:
-                        self._semantic_error(
-                            f"{rightSignalName} " +
-                            _("input is already connected."),
-                            symbol_store_right.get("device_id")
-                        )
-                    elif error_type == self.network.INPUT_TO_INPUT:
-                        self._semantic_error(_("Both ports are inputs."))
-                    elif error_type == self.network.PORT_ABSENT:
-                        self._semantic_error(_("Right port id is invalid."),
-                                             symbol_store_right.get("port_id"))
-                    elif error_type == self.network.OUTPUT_TO_OUTPUT:
-                        self._semantic_error(_("Both ports are outputs."))
-
-                self._set_next()
-                if self.unclosed_comment:
-                    return True
-                break
+        self._set_next()
+        if self.unclosed_comment:
+            return True
 
-            else:
-                # syntax errors found in connection
-                self._set_next()
-                if self.unclosed_comment:
-                    return True
+        (
+            missing_signal_end_marker,
+            rightOutputId,
+            rightPortId,
+            symbol_store_right
+        ) = self._parse_signal()
+        if self.end_of_file or missing_signal_end_marker:
+            # if time, print a warning
+            return missing_signal_end_marker
+
+        if self.error_count - previous_errors == 0:
+            # no syntax errors found when parsing connection
+            error_type = self._make_connection(
+                leftOutputId, leftPortId, rightOutputId, rightPortId
+            )
 
-                break
+            if error_type != self.network.NO_ERROR:
+                message, at = self._connection_errors[error_type]
+                self._semantic_error(
+                    message.format(
+                        signal=self._signal_name(rightOutputId, rightPortId)),
+                    symbol_store_right.get(at)
+                )
+
+        self._set_next()
+        if self.unclosed_comment:
+            return True
 
-        return missing_signal_end_marker
+        return False
 
     def _parse_signal(self):
         """Parse a signal name."""
-        missing_end_marker = False
-        signalName = ""
-        deviceId = None
-        portId = None
         symbol_store = {}
 
-        while True:
-            if self.symbol.type != self.scanner.NAME:
-                self._error(
-                    _("Expected an output name here"),
-                    [self.scanner.NAME]
-                )
-                break
+        if self.symbol.type != NAME:
+            self._error(
+                _("Expected an output name here"),
+                self._next_signal
+            )
+            return False, None, None, symbol_store
 
-            signalName += self.names.get_name_string(self.symbol.id)
-            deviceId = self.symbol.id
-            symbol_store["device_id"] = self.symbol
+        deviceId = self.symbol.id
+        symbol_store["device_id"] = self.symbol
+        self._set_next()
+        if self.unclosed_comment:
+            return True, None, None, None
+
+        portId = None
+        if self.symbol.id == self.scanner.DOT:
             self._set_next()
             if self.unclosed_comment:
-                return True, None, None, None, None
-
-            if self.symbol.id == self.scanner.DOT:
-                signalName += "."
-                self._set_next()
-                if self.unclosed_comment:
-                    return True, None, None, None, None
+                return True, None, None, None
 
-                if self.symbol.type != self.scanner.NAME:
-                    self._error(
-                        _("expected a port name here"), [
-                            self.scanner.NAME])
-                    break
+            if self.symbol.type != NAME:
+                self._error(
+                    _("expected a port name here"), self._next_signal)
+                return False, deviceId, None, symbol_store
 
-                signalName += self.names.get_name_string(self.symbol.id)
-                portId = self.symbol.id
-                symbol_store["port_id"] = self.symbol
+            portId = self.symbol.id
+            symbol_store["port_id"] = self.symbol
 
-                self._set_next()
-                if self.unclosed_comment:
-                    return True, None, None, None, None
+            self._set_next()
+            if self.unclosed_comment:
+                return True, None, None, None
 
-            if (
-                    self.symbol.id != self.scanner.COLON
-                    and self.symbol.id != self.scanner.SEMICOLON
-            ):
-                missing_end_marker = True
-                self._error(
-                    _("missing ':' or ';'"),
-                    [
-                        self.scanner.NAME,
-                        self.scanner.CLOSE_SQUARE,
-                        self.scanner.MONITOR_ID,
-                    ],
-                )
-                break
+        if (
+                self.symbol.id != self.scanner.COLON
+                and self.symbol.id != self.scanner.SEMICOLON
+        ):
+            self._error(
+                _("missing ':' or ';'"), self._after_signal)
+            return True, deviceId, portId, symbol_store
 
-            break
+        return False, deviceId, portId, symbol_store
 
-        return missing_end_marker, deviceId, portId, signalName, symbol_store
+    def _signal_name(self, device_id, port_id):
+        """Return the name of a signal, as written in the definition file."""
+        # only semantic error messages need the name, so it is joined here
+        # when one is reported rather than for every signal parsed
+        if port_id is None:
+            return self._get_name_string(device_id)
+        return ".".join((self._get_name_string(device_id),
+                         self._get_name_string(port_id)))
 
     def _parse_monitors_list(self, previous_errors):
         """Parse list of monitors."""
+        CONNECTIONS_ID = self.scanner.CONNECTIONS_ID
+        CLOSE_SQUARE = self.scanner.CLOSE_SQUARE
+
         self._set_next()
         while True:
             if self.end_of_file:
                 break
             if self.symbol.id != self.scanner.OPEN_SQUARE:
                 self._error(
-                    _("expected") + " [", [
-                        self.scanner.CONNECTIONS_ID, self.scanner.EOF])
+                    _("expected") + " [", self._after_monitors)
                 break
             self._set_next()
 
-            parsing_monitors = True
-            while parsing_monitors:
+            while True:
                 if self.end_of_file:
                     break
 
-                if self.symbol.id == self.scanner.CLOSE_SQUARE:
-                    parsing_monitors = False
+                if self.symbol.id == CLOSE_SQUARE:
                     break
 
                 missing_semicolon = self._parse_monitor(self.error_count)
@@ -899,40 +783,39 @@ class Parser:
                 if missing_semicolon:
                     # if an error is found in _parse_monitor we should break
                     # here
-                    if self.symbol.id == self.scanner.CONNECTIONS_ID:
+                    if self.symbol.id == CONNECTIONS_ID:
                         break
 
                     continue
 
-                if self.symbol.type == self.scanner.NAME:
-                    parsing_monitors = True
-                elif self.symbol.id == self.scanner.CLOSE_SQUARE:
-                    parsing_monitors = False
-                elif self.symbol.id == self.scanner.CONNECTIONS_ID:
-                    parsing_monitors = False
+                if self.symbol.type == NAME:
+                    continue
+                elif (
+                        self.symbol.id == CLOSE_SQUARE
+                        or self.symbol.id == CONNECTIONS_ID
+                ):
                     break
-                elif self.symbol.type == self.scanner.INVALID_CHAR:
+                elif self.symbol.type == INVALID_CHAR:
                     # unknown character encountered
                     self._error(
-                        _("invalid character encountered"), [
-                            self.scanner.NAME])
+                        _("invalid character encountered"), self._next_signal)
                 else:
                     # To be tested further - kept now to prevent infinite loops
-                    print(_("Unknown Error"))
+                    err = _("Unknown Error")
+                    self.error_message_list.append(err)
                     self.error_count += 1
                     break
 
             if self.end_of_file:
                 break
 
-            if self.symbol.id == self.scanner.CONNECTIONS_ID:
+            if self.symbol.id == CONNECTIONS_ID:
                 break
 
             # no longer parsing monitors
-            if self.symbol.id != self.scanner.CLOSE_SQUARE:
+            if self.symbol.id != CLOSE_SQUARE:
                 self._error(
-                    _("expected") + " ]", [
-                        self.scanner.CONNECTIONS_ID, self.scanner.EOF])
+                    _("expected") + " ]", self._after_monitors)
                 break
 
             self._set_next()
@@ -941,20 +824,19 @@ class Parser:
 
             if self.symbol.id != self.scanner.SEMICOLON:
                 self._error(
-                    _("expected") + " ;", [
-                        self.scanner.EOF, self.scanner.CONNECTIONS_ID])
+                    _("expected") + " ;", self._after_monitors)
                 break
 
             if self.error_count - previous_errors != 0:
                 break
 
-            print(_("Successfully parsed the MONITORS list! \n"))
+            log.debug(_("Successfully parsed the MONITORS list! \n"))
             self._set_next()
             return True
 
         if (
-                self.symbol.id != self.scanner.CONNECTIONS_ID
-                and self.symbol.id != self.scanner.EOF
+                self.symbol.id != CONNECTIONS_ID
+                and self.symbol.id != EOF
         ):
             self._set_next()
 
@@ -965,64 +847,43 @@ class Parser:
                     _("MONITORS list \n")
             )
 
-            print(err)
-
             self.error_message_list.append(err)
             return False
 
     def _parse_monitor(self, previous_errors):
         """Parse a single monitor."""
-        missing_semicolon = False
-        symbol_store = {}
-        while True:
-            if self.symbol.id == self.scanner.SEMICOLON:
-                self._error(
-                    _("No signal found before semicolon"), [
-                        self.scanner.NAME])
-                break
-            (missing_semicolon, deviceId,
-             portId, signalName, symbol_store) = self._parse_signal()
-            if self.end_of_file:
-                break
-            if missing_semicolon:
-                # skip to next monitor
-                break
-
-            if self.error_count - previous_errors == 0:
-                # no syntax errors found when parsing monitor
-                error_type = self.monitors.make_monitor(deviceId, portId)
-
-                if error_type != self.monitors.NO_ERROR:
-                    if error_type == self.network.DEVICE_ABSENT:
-                        self._semantic_error(
-                            _("Device you are trying to monitor is absent."),
-                            symbol_store.get("device_id")
-                        )
-                    elif error_type == self.monitors.NOT_OUTPUT:
-                        self._semantic_error(
-                            f"{signalName} " +
-                            _("is not an output."))
-                    elif error_type == self.monitors.MONITOR_PRESENT:
-                        self._semantic_error(
-                            _("Already monitoring") + f" {signalName}.",
-                            symbol_store.get("device_id"))
-
-                self._set_next()
-                # semantically correct
-                break
+        if self.symbol.id == self.scanner.SEMICOLON:
+            self._error(
+                _("No signal found before semicolon"), self._next_signal)
+            return False
 
-            else:
-                # syntax errors found, no checking of semantics will occur
-                self._set_next()
-                break
+        (missing_semicolon, deviceId,
+         portId, symbol_store) = self._parse_signal()
+        if self.end_of_file or missing_semicolon:
+            # skip to next monitor
+            return missing_semicolon
+
+        if self.error_count - previous_errors == 0:
+            # no syntax errors found when parsing monitor
+            error_type = self._make_monitor(deviceId, portId)
+
+            if error_type != self.monitors.NO_ERROR:
+                message, at = self._monitor_errors[error_type]
+                self._semantic_error(
+                    message.format(
+                        signal=self._signal_name(deviceId, portId)),
+                    symbol_store.get(at)
+                )
 
-        return missing_semicolon
+        # move past the semicolon whether or not the monitor was built
+        self._set_next()
+        return False
 
     def _set_next(self):
         """Shift current symbol to next."""
-        self.symbol = self.scanner.get_symbol()
+        self.symbol = symbol = self._get_symbol()
 
-        if self.symbol.type == self.scanner.UNCLOSED:
+        if symbol.type == UNCLOSED:
             self.unclosed_comment = True
 
             self._error(
@@ -1033,65 +894,93 @@ class Parser:
 
             self.end_of_file = True
 
+    def _expect(self, symbol_id, msg, expect_next_list):
+        """Move past the current symbol if it is symbol_id.
+
+        Otherwise report msg and recover. Return True if the symbol matched,
+        False if it did not and None if an unclosed comment was found.
+        """
+        if self.symbol.id != symbol_id:
+            self._error(msg, expect_next_list)
+            return False
+
+        self._set_next()
+        if self.unclosed_comment:
+            return None
+
+        return True
+
+    def _expect_all(self, expected, expect_next_list):
+        """Move past a fixed run of symbols, stopping at the first mismatch.
+
+        expected is a sequence of (symbol_id, msg) pairs, each handled as in
+        _expect, whose result is returned.
+        """
+        for symbol_id, msg in expected:
+            matched = self._expect(symbol_id, msg, expect_next_list)
+            if not matched:
+                return matched
+
+        return True
+
     def _get_symbol_string(self):
         """More easily print current symbol string."""
-        try:
-            return self.names.get_name_string(self.symbol.id)
-        except TypeError:
+        # EOF, invalid and unclosed symbols carry no id, which is the
+        # TypeError get_name_string would raise. a NUMBER symbol's id is its
+        # value, not a name id, so it is still looked up as one and can
+        # raise ValueError if it is past the end of the names list
+        if not isinstance(self.symbol.id, int):
             return "NONE"
+        return self._get_name_string(self.symbol.id)
 
     def _error(self, msg, expect_next_list):
         """Print error message and recover from next semicolon."""
+        SEMICOLON = self.scanner.SEMICOLON
+        set_next = self._set_next  # called once per skipped symbol
+
         self.error_count += 1
 
         caret_msg, line_num, col_num = self.scanner.show_error(self.symbol)
 
         # loading empty file error handling
-        if self.symbol.type == self.scanner.EOF:
+        if self.symbol.type == EOF:
             full_error_message = _("ERROR on line") + \
                                  f"{line_num} " + _("index") + \
                                  f"{col_num}: {msg} "
-            print(full_error_message)
             self.error_message_list.append(full_error_message)
             self.end_of_file = True
             return
 
         self.end_of_file = False
 
+        # the symbol string is looked up once and only the message is
+        # chosen per case - printing and storing it is shared
         received_symbol = self._get_symbol_string()
         if received_symbol == "NONE":  # the case if not in names list,
             # i.e unclosed comment
             full_error_message = _("ERROR on line") + \
                                  f"{line_num} " + _("index") + \
                                  f"{col_num}: {msg} "
-
-            print(full_error_message)
-            self.error_message_list.append(full_error_message)
         else:
             full_error_message = _("ERROR on line ") + \
                                  f"{line_num} " + _("index ") + \
                                  f"{col_num}: {msg} " + \
                                  _(", received ") + \
-                                 f"{self._get_symbol_string()} "
-            print(full_error_message)
-            self.error_message_list.append(full_error_message)
+                                 f"{received_symbol} "
 
-        self.error_message_list.append(caret_msg)
-        print(caret_msg)
+        self.error_message_list.extend((full_error_message, caret_msg))
 
         while True:
-            while self.symbol.id != self.scanner.SEMICOLON:
+            while self.symbol.id != SEMICOLON:
 
-                self._set_next()
+                set_next()
                 if self.unclosed_comment:
                     return
 
-                self._get_symbol_string()
-                if self._is_eof():
+                if self.symbol.type == EOF:
                     message = _("Reached end of file without finding another")\
                               + \
                               _(" semicolon - cannot perform error recovery.")
-                    print(message)
                     self.error_message_list.append(f"\n{message}")
 
                     self.end_of_file = True
@@ -1100,12 +989,11 @@ class Parser:
             # found a semi colon, now need to check if the expected element
             # is next
 
-            self._set_next()
+            set_next()
             if self.unclosed_comment:
                 return
 
-            self._get_symbol_string()  # for pytest mocking
-            if self._is_eof():
+            if self.symbol.type == EOF:
                 # end of file is found before the error recovery symbol is
                 # found
                 break
@@ -1115,13 +1003,8 @@ class Parser:
             ):
                 # found the character we want to keep parsing, therefore we
                 # resume in the parsing
-                self._get_symbol_string()  # for pytest mocking
                 break
 
-    def _is_eof(self):
-        """Check if current symbol is end of file."""
-        return self.symbol.type == self.scanner.EOF
-
     def _semantic_error(self, msg, offending_symbol=None):
         """Print semantic error with message."""
         self.error_count += 1
@@ -1138,8 +1021,4 @@ class Parser:
             f"{line_num} " + _("index ") + \
             f"{col_num}: {msg} "
 
-        print(err)
-        print(caret_msg)
-
-        self.error_message_list.append(err)
-        self.error_message_list.append(caret_msg)
+        self.error_message_list.extend((err, caret_msg))
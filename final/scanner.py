@@ -10,6 +10,18 @@ Symbol - encapsulates a symbol and stores its properties.
 import sys
 import pathlib
 
+# symbol types do not depend on the names table, so they are the same for
+# every scanner and can be imported directly by the parser
+SYMBOL_TYPES = [
+    PUNCTUATION,
+    KEYWORD,
+    NUMBER,
+    NAME,
+    EOF,
+    INVALID_CHAR,
+    UNCLOSED
+] = range(7)
+
 
 class Symbol:
     """Encapsulate a symbol and store its properties.
@@ -22,6 +34,8 @@ class Symbol:
     No public methods.
     """
 
+    __slots__ = ("type", "id", "pos", "line", "linestart")
+
     def __init__(self):
         """Initialise symbol properties."""
         self.type = None
@@ -70,7 +84,7 @@ class Scanner:
             self.EOF,
             self.INVALID_CHAR,
             self.UNCLOSED
-        ] = range(7)
+        ] = SYMBOL_TYPES
 
         self.keywords = [
             "CIRCUIT",
@@ -103,6 +117,11 @@ class Scanner:
             self.DOT,
         ] = self.names.lookup(self.puncs)
 
+        # hashed copies for the membership tests made on every name and
+        # character; the lists above keep the order their IDs are assigned in
+        self.keyword_set = frozenset(self.keywords)
+        self.punc_set = frozenset(self.puncs)
+
     def _open_file(self, path):
         """Open and return the file specified by path."""
         directory = pathlib.Path().resolve()
@@ -139,7 +158,7 @@ class Scanner:
         """Return True if current character is invalid."""
         char = self.current_char
         if not char.isspace() and not char.isalnum():
-            if char != "" and char not in self.puncs and char not in [
+            if char != "" and char not in self.punc_set and char not in [
                     '/', '#']:
                 return True
         return False
@@ -154,9 +173,14 @@ class Scanner:
         symb.pos = self.f.tell()
         symb.line = self.linecount
         symb.linestart = self.linestart
-        while self.current_char.isalnum() or self._invalid_current():
-            if self._invalid_current():
-                inv = True
+        # alphanumeric characters are never invalid, so _invalid_current
+        # only needs checking once, and only for the other characters
+        while True:
+            if not self.current_char.isalnum():
+                if self._invalid_current():
+                    inv = True
+                else:
+                    break
             name += self.current_char
             self._next()
         return name, inv
@@ -171,12 +195,15 @@ class Scanner:
         symb.pos = self.f.tell()
         symb.line = self.linecount
         symb.linestart = self.linestart
-        while self.current_char.isdigit() or self._invalid_current():
-            if self._invalid_current():
+        while True:
+            if self.current_char.isdigit():
+                n += self.current_char
+                self._next()
+            elif self._invalid_current():
                 inv = True
                 return None, inv
-            n += self.current_char
-            self._next()
+            else:
+                break
         return int(n), inv
 
     def _skip_comment(self):
@@ -232,35 +259,35 @@ class Scanner:
         if uc_comment:
             sym.pos = uc_start
             sym.line = uc_line
-            sym.type = self.UNCLOSED
+            sym.type = UNCLOSED
             sym.linestart = uc_ls
 
         # name/keyword
         elif self.current_char.isalpha():
             name_string, inv = self._next_name(sym)
             if inv:
-                sym.type = self.INVALID_CHAR
-            elif name_string in self.keywords:
-                sym.type = self.KEYWORD
+                sym.type = INVALID_CHAR
+            elif name_string in self.keyword_set:
+                sym.type = KEYWORD
                 [sym.id] = self.names.lookup([name_string])
             else:
-                sym.type = self.NAME
+                sym.type = NAME
                 [sym.id] = self.names.lookup([name_string])
 
         # number
         elif self.current_char.isdigit():
             sym.id, inv = self._next_number(sym)
             if inv:
-                sym.type = self.INVALID_CHAR
+                sym.type = INVALID_CHAR
             else:
-                sym.type = self.NUMBER
+                sym.type = NUMBER
 
         # punctuation
-        elif self.current_char in self.puncs:
+        elif self.current_char in self.punc_set:
             sym.pos = self.f.tell()
             sym.line = self.linecount
             sym.linestart = self.linestart
-            sym.type = self.PUNCTUATION
+            sym.type = PUNCTUATION
             sym.id = self.names.query(self.current_char)
             self._next()
 
@@ -269,11 +296,11 @@ class Scanner:
             sym.pos = self.f.tell()
             sym.line = self.linecount
             sym.linestart = self.linestart
-            sym.type = self.EOF
+            sym.type = EOF
 
         # invalid character
         else:
-            sym.type = self.INVALID_CHAR
+            sym.type = INVALID_CHAR
             sym.pos = self.f.tell()
             sym.line = self.linecount
             sym.linestart = self.linestart
@@ -305,7 +332,7 @@ class Scanner:
 
         if error_pos == error_linestart:  # "if symbol is at start of line"
             # "if there is a previous line and symbol is not unclosed comment"
-            if error_linestart != 1 and symbol.type != self.UNCLOSED:
+            if error_linestart != 1 and symbol.type != UNCLOSED:
                 self.f.seek(prev_linestart - 1)
                 errorline1 = self._get_error_line()
 
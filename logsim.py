@@ -9,8 +9,10 @@ Usage
 Show help: logsim.py -h
 Command line user interface: logsim.py -c <file path>
 Graphical user interface: logsim.py <file path>
+Log parser progress: add -v to either of the above
 """
 import getopt
+import logging
 import os
 import sys
 import builtins
@@ -120,14 +122,21 @@ def main(arg_list):
     usage_message = ("Usage:\n"
                      "Show help: logsim.py -h\n"
                      "Command line user interface: logsim.py -c <file path>\n"
-                     "Graphical user interface: logsim.py <file path>")
+                     "Graphical user interface: logsim.py <file path>\n"
+                     "Log parser progress: add -v to either of the above")
     try:
-        options, arguments = getopt.getopt(arg_list, "hc:")
+        options, arguments = getopt.getopt(arg_list, "hvc:")
     except getopt.GetoptError:
         print("Error: invalid command line arguments\n")
         print(usage_message)
         sys.exit()
 
+    if ("-v", "") in options:  # show the parser's progress messages only
+        parse_log = logging.getLogger("parse")
+        parse_log.setLevel(logging.DEBUG)
+        parse_log.addHandler(logging.StreamHandler())
+        options = [option for option in options if option != ("-v", "")]
+
     # Initialise instances of the four inner simulator classes
     names = Names()
     devices = Devices(names)
@@ -141,7 +150,9 @@ def main(arg_list):
         elif option == "-c":  # use the command line user interface
             scanner = Scanner(path, names)
             parser = Parser(names, devices, network, monitors, scanner)
-            if parser.parse_network():
+            success = parser.parse_network()
+            parser.report()  # errors are only shown on the terminal
+            if success:
                 # Initialise an instance of the userint.UserInterface() class
                 userint = UserInterface(names, devices, network, monitors)
                 userint.command_interface()
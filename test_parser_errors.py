@@ -275,7 +275,8 @@ class TestParserDevices:
 
         parser_obj._parse_device_kind()
         assert spy_parse_device_kind.spy_return[0] == missing_semicolon
-        assert spy_parse_device_kind.spy_return[1] == device_kind_string
+        assert spy_parse_device_kind.spy_return[1] == \
+            parser_obj.names.query(device_kind_string)
         assert spy_error.call_count == error_calls
 
     @pytest.mark.parametrize("text_file, missing_semicolon, "
@@ -566,10 +567,8 @@ class TestParserErrorRecovery:
             return "caret message", "ln", "cn"
         mocker.patch('scanner.Scanner.show_error', mock_scanner_error)
 
-        spy_symbol_id = mocker.spy(parser_obj, "_get_symbol_string")
-
         parser_obj._parse_devices_list()
-        assert spy_symbol_id.spy_return == expected_symbol_string
+        assert parser_obj._get_symbol_string() == expected_symbol_string
 
     @pytest.mark.parametrize("text_file, expected_symbol_string",
                              [("er_parse_device_bad_id.txt",
@@ -591,10 +590,8 @@ class TestParserErrorRecovery:
             return "caret message", "ln", "cn"
         mocker.patch('scanner.Scanner.show_error', mock_scanner_error)
 
-        spy_symbol_id = mocker.spy(parser_obj, "_get_symbol_string")
-
         parser_obj._parse_device_id()
-        assert spy_symbol_id.spy_return == expected_symbol_string
+        assert parser_obj._get_symbol_string() == expected_symbol_string
 
 
 def test_empty_file():
@@ -611,6 +608,28 @@ def test_empty_file():
     assert not result
 
 
+def test_report(capsys):
+    """Test messages are only printed when report is called"""
+    parser_obj = new_parser(f"test_files/empty_file_error_test.txt")
+
+    parser_obj.parse_network()
+    assert capsys.readouterr().out == ""
+
+    parser_obj.report()
+    printed = capsys.readouterr().out
+    assert printed == "".join(f"{message}\n"
+                              for message in parser_obj.error_message_list)
+
+
+def test_missed_colon_warning_reported():
+    """Test the connection recovery warning is kept for report and the GUI"""
+    parser_obj = new_parser(f"test_files/broken_connections.txt")
+
+    parser_obj.parse_network()
+    assert ("missed colon in connection, will skip to next connection"
+            in parser_obj.error_message_list)
+
+
 @pytest.mark.parametrize("text_file, expected_number_errors",
                          [
                              ("within_devices.txt", 2),